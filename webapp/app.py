@@ -7,8 +7,9 @@ from datetime import datetime
 import uuid
 from pathlib import Path
 from webapp.utils.export import export_to_csv, export_to_pdf
-from utils.analytics import calculate_summary
+from utils.analytics import calculate_summary, filter_entries
 from webapp.utils.chart import get_trend_chart_data, get_category_chart_data
+from webapp.utils.batch import run_batch, validate_batch
 
 app = Flask(__name__, static_folder='static')
 CORS(app)
@@ -90,34 +91,14 @@ def get_entries():
     """Get filtered entries"""
     try:
         entries = load_transactions()
-        
-        # Filtering parameters
-        entry_type = request.args.get('type')  # 'credit' or 'debit'
-        category = request.args.get('category')
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
-        search = request.args.get('search')
-        
-        filtered = entries
-        
-        if entry_type:
-            filtered = [e for e in filtered if e['type'] == entry_type]
-        
-        if category:
-            filtered = [e for e in filtered if e['category'] == category]
-        
-        if start_date:
-            filtered = [e for e in filtered if e['date'] >= start_date]
-        
-        if end_date:
-            filtered = [e for e in filtered if e['date'] <= end_date]
-        
-        if search:
-            search_lower = search.lower()
-            filtered = [e for e in filtered if search_lower in e['description'].lower()]
-        
-        # Sorting
-        filtered.sort(key=lambda x: (x['date'], x['timestamp']), reverse=True)
+        filtered = filter_entries(
+            entries,
+            entry_type=request.args.get('type'),  # 'credit' or 'debit'
+            category=request.args.get('category'),
+            start_date=request.args.get('start_date'),
+            end_date=request.args.get('end_date'),
+            search=request.args.get('search')
+        )
         
         return jsonify(filtered)
     except Exception as e:
@@ -254,6 +235,21 @@ def get_category_chart():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/batch', methods=['POST'])
+def batch_query():
+    """Answer several dashboard queries from one load of the ledger"""
+    try:
+        data = request.get_json(silent=True)
+        queries = data.get('queries') if isinstance(data, dict) else None
+        valid, message = validate_batch(queries)
+        if not valid:
+            return jsonify({"error": message}), 400
+        
+        entries = load_transactions()
+        return jsonify(run_batch(entries, queries))
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
 @app.route('/api/transactions/export/csv')
 def export_csv():
     """Export transactions as CSV"""
@@ -36,8 +36,7 @@ document.addEventListener('DOMContentLoaded', function() {
     setupFloatingActionButtons();
     
     // Load initial data
-    loadEntries();
-    loadSummary();
+    loadDashboard();
     
     // Form submissions
     document.getElementById('expenseForm').addEventListener('submit', addDebit);
@@ -195,64 +194,101 @@ function showToast(message, type = 'success') {
     }, 3000);
 }
 
-// Load entries from API
-async function loadEntries() {
+// Load entries, summary and both charts in a single batch request
+async function loadDashboard() {
     try {
-        const response = await fetch(`/api/entries`);
+        const response = await fetch(`/api/batch`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                queries: [
+                    { id: 'entries', type: 'entries' },
+                    { id: 'summary', type: 'summary' },
+                    {
+                        id: 'trend',
+                        type: 'trend',
+                        params: {
+                            timeframe: document.getElementById('trendTimeframe').value,
+                            type: document.getElementById('trendType').value
+                        }
+                    },
+                    {
+                        id: 'categories',
+                        type: 'categories',
+                        params: {
+                            timeframe: document.getElementById('categoryTimeframe').value,
+                            type: document.getElementById('categoryType').value
+                        }
+                    }
+                ]
+            })
+        });
         if (!response.ok) {
             throw new Error(`HTTP error! status: ${response.status}`);
         }
-        entries = await response.json();
+        const { results, errors } = await response.json();
+        
+        if (errors.entries) throw new Error(errors.entries);
+        entries = results.entries;
         filteredEntries = [...entries];
         renderEntries();
-        renderTrendChart();
-        renderCategoryChart();
         updateSplurgeInfo();
-    } catch (error) {
-        console.error("Error fetching entries:", error);
-        showToast("Failed to load entries. Please try again.", "error");
-    }
-}
-
-// Load summary data
-async function loadSummary() {
-    try {
-        const response = await fetch(`/api/analytics/summary`);
-        if (!response.ok) {
-            throw new Error(`HTTP error! status: ${response.status}`);
-        }
-        const summary = await response.json();
-        
-        // Update top 4 cards
-        document.getElementById('totalIncome').textContent = `₹${summary.total_credits.toFixed(2)}`;
-        document.getElementById('totalExpenses').textContent = `₹${summary.total_debits.toFixed(2)}`;
-        document.getElementById('netSavings').textContent = `₹${summary.net_balance.toFixed(2)}`;
-        document.getElementById('dailyAverage').textContent = `₹${summary.daily_average.toFixed(2)}`;
         
-        // Update percentage changes
-        updatePercentageChange('incomeChange', summary.percent_change_credits);
-        updatePercentageChange('expenseChange', summary.percent_change_debits);
-        updatePercentageChange('balanceChange', summary.percent_change_balance);
-        updatePercentageChange('dailyChange', summary.percent_change_daily);
-        
-        // Update lower 4 cards
-        updateHighestDisplay(summary.highest_debit_day, 'highestSpendingDay', 'debit', 'day');
-        updateHighestDisplay(summary.highest_credit_day, 'highestIncomeDay', 'credit', 'day');
-        updateHighestDisplay(summary.highest_debit_category, 'highestSpendingCategory', 'debit', 'category');
-        updateHighestDisplay(summary.highest_credit_category, 'highestIncomeCategory', 'credit', 'category');
+        if (results.summary) {
+            updateSummaryCards(results.summary);
+        } else {
+            console.error("Error fetching summary:", errors.summary);
+        }
         
-        // Color net savings based on value
-        const netSavingsEl = document.getElementById('netSavings');
-        if (summary.net_balance >= 0) {
-            netSavingsEl.classList.remove('text-danger-500');
-            netSavingsEl.classList.add('text-success-500');
+        if (results.trend) {
+            drawTrendChart(results.trend);
         } else {
-            netSavingsEl.classList.remove('text-success-500');
-            netSavingsEl.classList.add('text-danger-500');
+            console.error("Error rendering trend chart:", errors.trend);
+            showToast("Failed to load trend data", "error");
         }
         
+        if (results.categories) {
+            drawCategoryChart(results.categories);
+        } else {
+            console.error("Error rendering category chart:", errors.categories);
+            showToast("Failed to load category data", "error");
+        }
     } catch (error) {
-        console.error("Error fetching summary:", error);
+        console.error("Error fetching entries:", error);
+        showToast("Failed to load entries. Please try again.", "error");
+    }
+}
+
+// Update summary cards
+function updateSummaryCards(summary) {
+    // Update top 4 cards
+    document.getElementById('totalIncome').textContent = `₹${summary.total_credits.toFixed(2)}`;
+    document.getElementById('totalExpenses').textContent = `₹${summary.total_debits.toFixed(2)}`;
+    document.getElementById('netSavings').textContent = `₹${summary.net_balance.toFixed(2)}`;
+    document.getElementById('dailyAverage').textContent = `₹${summary.daily_average.toFixed(2)}`;
+    
+    // Update percentage changes
+    updatePercentageChange('incomeChange', summary.percent_change_credits);
+    updatePercentageChange('expenseChange', summary.percent_change_debits);
+    updatePercentageChange('balanceChange', summary.percent_change_balance);
+    updatePercentageChange('dailyChange', summary.percent_change_daily);
+    
+    // Update lower 4 cards
+    updateHighestDisplay(summary.highest_debit_day, 'highestSpendingDay', 'debit', 'day');
+    updateHighestDisplay(summary.highest_credit_day, 'highestIncomeDay', 'credit', 'day');
+    updateHighestDisplay(summary.highest_debit_category, 'highestSpendingCategory', 'debit', 'category');
+    updateHighestDisplay(summary.highest_credit_category, 'highestIncomeCategory', 'credit', 'category');
+    
+    // Color net savings based on value
+    const netSavingsEl = document.getElementById('netSavings');
+    if (summary.net_balance >= 0) {
+        netSavingsEl.classList.remove('text-danger-500');
+        netSavingsEl.classList.add('text-success-500');
+    } else {
+        netSavingsEl.classList.remove('text-success-500');
+        netSavingsEl.classList.add('text-danger-500');
     }
 }
 
@@ -408,77 +444,81 @@ async function renderTrendChart() {
         const response = await fetch(`/api/charts/trend?timeframe=${timeframe}&type=${chartType}`);
         if (!response.ok) throw new Error('Failed to load trend data');
         
-        const chartData = await response.json();
-        
-        const ctx = document.getElementById('trendChart').getContext('2d');
-        
-        if (trendChart) trendChart.destroy();
-        
-        trendChart = new Chart(ctx, {
-            type: 'bar',
-            data: {
-                labels: chartData.labels,
-                datasets: chartData.datasets.map(ds => ({
-                    ...ds,
-                    label: ds.label === 'Income' ? 'Credits' : ds.label === 'Expense' ? 'Debits' : ds.label,
-                    borderWidth: 1
-                }))
-            },
-            options: {
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {
-                    legend: {
-                        labels: {
-                            color: '#1e293b'
-                        }
-                    },
-                    title: {
-                        display: true,
-                        text: `${chartType === 'hybrid' ? 'Credit & Debit' : chartType.charAt(0).toUpperCase() + chartType.slice(1)} Trend`,
-                        font: {
-                            size: 14,
-                            weight: '500'
-                        },
+        drawTrendChart(await response.json());
+    } catch (error) {
+        console.error("Error rendering trend chart:", error);
+        showToast("Failed to load trend data", "error");
+    }
+}
+
+// Draw trend chart from chart data
+function drawTrendChart(chartData) {
+    const chartType = document.getElementById('trendType').value;
+    const ctx = document.getElementById('trendChart').getContext('2d');
+    
+    if (trendChart) trendChart.destroy();
+    
+    trendChart = new Chart(ctx, {
+        type: 'bar',
+        data: {
+            labels: chartData.labels,
+            datasets: chartData.datasets.map(ds => ({
+                ...ds,
+                label: ds.label === 'Income' ? 'Credits' : ds.label === 'Expense' ? 'Debits' : ds.label,
+                borderWidth: 1
+            }))
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                legend: {
+                    labels: {
                         color: '#1e293b'
+                    }
+                },
+                title: {
+                    display: true,
+                    text: `${chartType === 'hybrid' ? 'Credit & Debit' : chartType.charAt(0).toUpperCase() + chartType.slice(1)} Trend`,
+                    font: {
+                        size: 14,
+                        weight: '500'
                     },
-                    tooltip: {
-                        callbacks: {
-                            label: function(context) {
-                                return `${context.dataset.label}: ₹${context.raw.toFixed(2)}`;
-                            }
+                    color: '#1e293b'
+                },
+                tooltip: {
+                    callbacks: {
+                        label: function(context) {
+                            return `${context.dataset.label}: ₹${context.raw.toFixed(2)}`;
                         }
                     }
-                },
-                scales: {
-                    y: {
-                        beginAtZero: true,
-                        ticks: {
-                            callback: function(value) {
-                                return `₹${value}`;
-                            },
-                            color: '#64748b'
+                }
+            },
+            scales: {
+                y: {
+                    beginAtZero: true,
+                    ticks: {
+                        callback: function(value) {
+                            return `₹${value}`;
                         },
-                        grid: {
-                            color: '#e2e8f0'
-                        }
+                        color: '#64748b'
                     },
-                    x: {
-                        stacked: chartType === 'hybrid',
-                        grid: {
-                            display: false
-                        },
-                        ticks: {
-                            color: '#64748b'
-                        }
+                    grid: {
+                        color: '#e2e8f0'
+                    }
+                },
+                x: {
+                    stacked: chartType === 'hybrid',
+                    grid: {
+                        display: false
+                    },
+                    ticks: {
+                        color: '#64748b'
                     }
                 }
             }
-        });
-    } catch (error) {
-        console.error("Error rendering trend chart:", error);
-        showToast("Failed to load trend data", "error");
-    }
+        }
+    });
 }
 
 // Render category chart
@@ -490,59 +530,62 @@ async function renderCategoryChart() {
         const response = await fetch(`/api/charts/categories?timeframe=${timeframe}&type=${chartType}`);
         if (!response.ok) throw new Error('Failed to load category data');
         
-        const chartData = await response.json();
-        
-        const ctx = document.getElementById('categoryChart').getContext('2d');
-        
-        if (categoryChart) categoryChart.destroy();
-        
-        categoryChart = new Chart(ctx, {
-            type: 'doughnut',
-            data: {
-                labels: chartData.labels,
-                datasets: [{
-                    data: chartData.datasets[0].data,
-                    backgroundColor: chartData.datasets[0].backgroundColor,
-                    borderWidth: 1
-                }]
-            },
-            options: {
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {
-                    title: {
-                        display: true,
-                        text: 'Category Breakdown',
-                        color: '#1e293b'
-                    },
-                    tooltip: {
-                        callbacks: {
-                            label: function(context) {
-                                const value = context.raw;
-                                const total = context.dataset.data.reduce((a, b) => a + b, 0);
-                                const percentage = Math.round((value / total) * 100);
-                                return `${context.label}: ₹${value.toFixed(2)} (${percentage}%)`;
-                            }
-                        }
-                    },
-                    legend: {
-                        position: 'right',
-                        labels: {
-                            boxWidth: 12,
-                            padding: 20,
-                            color: '#1e293b'
-                        }
-                    }
-                },
-                cutout: '70%'
-            }
-        });
+        drawCategoryChart(await response.json());
     } catch (error) {
         console.error("Error rendering category chart:", error);
         showToast("Failed to load category data", "error");
     }
 }
 
+// Draw category chart from chart data
+function drawCategoryChart(chartData) {
+    const ctx = document.getElementById('categoryChart').getContext('2d');
+    
+    if (categoryChart) categoryChart.destroy();
+    
+    categoryChart = new Chart(ctx, {
+        type: 'doughnut',
+        data: {
+            labels: chartData.labels,
+            datasets: [{
+                data: chartData.datasets[0].data,
+                backgroundColor: chartData.datasets[0].backgroundColor,
+                borderWidth: 1
+            }]
+        },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                title: {
+                    display: true,
+                    text: 'Category Breakdown',
+                    color: '#1e293b'
+                },
+                tooltip: {
+                    callbacks: {
+                        label: function(context) {
+                            const value = context.raw;
+                            const total = context.dataset.data.reduce((a, b) => a + b, 0);
+                            const percentage = Math.round((value / total) * 100);
+                            return `${context.label}: ₹${value.toFixed(2)} (${percentage}%)`;
+                        }
+                    }
+                },
+                legend: {
+                    position: 'right',
+                    labels: {
+                        boxWidth: 12,
+                        padding: 20,
+                        color: '#1e293b'
+                    }
+                }
+            },
+            cutout: '70%'
+        }
+    });
+}
+
 // Update splurge info (highest spending/credit)
 function updateSplurgeInfo() {
     // Group by day and type
@@ -605,8 +648,7 @@ async function confirmDeleteEntry() {
         
         showToast("Entry deleted successfully");
         document.getElementById('deleteModal').classList.add('hidden');
-        loadEntries();
-        loadSummary();
+        loadDashboard();
     } catch (error) {
         console.error("Error deleting entry:", error);
         showToast("Failed to delete entry", "error");
@@ -697,8 +739,7 @@ async function addDebit(e) {
         document.getElementById('expenseFormContainer').classList.remove('active');
         
         // Reload data
-        loadEntries();
-        loadSummary();
+        loadDashboard();
 
     } catch (error) {
         console.error("Error adding debit:", error);
@@ -747,8 +788,7 @@ async function addCredit(e) {
         document.getElementById('incomeFormContainer').classList.remove('active');
         
         // Reload data
-        loadEntries();
-        loadSummary();
+        loadDashboard();
     } catch (error) {
         console.error("Error adding credit:", error);
         showToast(`Failed to record credit: ${error.message}`, "error");
@@ -796,8 +836,7 @@ async function updateEntry(e) {
         document.getElementById('editModal').classList.add('hidden');
         
         // Reload data
-        loadEntries();
-        loadSummary();
+        loadDashboard();
     } catch (error) {
         console.error("Error updating entry:", error);
         showToast(`Failed to update entry: ${error.message}`, "error");
@@ -1,31 +1,37 @@
 from datetime import datetime, timedelta
 from collections import defaultdict
 
-def calculate_summary(transactions):
+SUMMARY_PERIOD_DAYS = 30
+
+def calculate_summary(transactions, end_date=None):
     """Calculate all summary metrics"""
     if not transactions:
         return empty_summary()
     
     # Current period (last 30 days)
-    end_date = datetime.now()
-    current_start_date = end_date - timedelta(days=30)
+    end_date = end_date or datetime.now()
+    current_start_date = end_date - timedelta(days=SUMMARY_PERIOD_DAYS)
     current_entries = filter_by_date_range(transactions, current_start_date, end_date)
     
     # Previous period (30 days before that)
-    previous_start_date = current_start_date - timedelta(days=30)
+    previous_start_date = current_start_date - timedelta(days=SUMMARY_PERIOD_DAYS)
     previous_entries = filter_by_date_range(transactions, previous_start_date, current_start_date)
     
+    return summarize_periods(current_entries, previous_entries)
+
+def summarize_periods(current_entries, previous_entries, highest_values=None):
+    """Build the summary from already filtered current and previous periods"""
     # Current period metrics
     current_credits = sum(float(e['amount']) for e in current_entries if e['type'] == 'credit')
     current_debits = sum(float(e['amount']) for e in current_entries if e['type'] == 'debit')
     current_net = current_credits - current_debits
-    current_daily_avg = current_debits / 30
+    current_daily_avg = current_debits / SUMMARY_PERIOD_DAYS
     
     # Previous period metrics
     previous_credits = sum(float(e['amount']) for e in previous_entries if e['type'] == 'credit')
     previous_debits = sum(float(e['amount']) for e in previous_entries if e['type'] == 'debit')
     previous_net = previous_credits - previous_debits
-    previous_daily_avg = previous_debits / 30
+    previous_daily_avg = previous_debits / SUMMARY_PERIOD_DAYS
     
     # Calculate percentage changes
     def calculate_change(current, previous):
@@ -34,7 +40,8 @@ def calculate_summary(transactions):
         return ((current - previous) / previous) * 100
     
     # Find highest values
-    highest_values = find_highest_values(current_entries)
+    if highest_values is None:
+        highest_values = find_highest_values(current_entries)
     
     return {
         "total_debits": round(current_debits, 2),
@@ -54,22 +61,52 @@ def filter_by_date_range(transactions, start_date, end_date):
             datetime.strptime(e['date'], '%Y-%m-%d') >= start_date and
             datetime.strptime(e['date'], '%Y-%m-%d') <= end_date]
 
-def find_highest_values(transactions):
-    """Find highest spending/income days and categories"""
-    daily_debits = defaultdict(float)
-    daily_credits = defaultdict(float)
-    debit_categories = defaultdict(float)
-    credit_categories = defaultdict(float)
+def filter_entries(transactions, entry_type=None, category=None, start_date=None,
+                   end_date=None, search=None):
+    """Filter entries the way the entries listing does, newest first"""
+    filtered = transactions
     
-    for entry in transactions:
-        amount = float(entry['amount'])
-        if entry['type'] == 'credit':
-            daily_credits[entry['date']] += amount
-            credit_categories[entry['category']] += amount
-        else:
-            daily_debits[entry['date']] += amount
-            debit_categories[entry['category']] += amount
+    if entry_type:
+        filtered = [e for e in filtered if e['type'] == entry_type]
+    
+    if category:
+        filtered = [e for e in filtered if e['category'] == category]
+    
+    if start_date:
+        filtered = [e for e in filtered if e['date'] >= start_date]
+    
+    if end_date:
+        filtered = [e for e in filtered if e['date'] <= end_date]
+    
+    if search:
+        search_lower = search.lower()
+        filtered = [e for e in filtered if search_lower in e['description'].lower()]
     
+    return sorted(filtered, key=lambda x: (x['date'], x['timestamp']), reverse=True)
+
+def aggregate_by_day(transactions):
+    """Sum amounts per date, keyed by type then date"""
+    daily = {'credit': defaultdict(float), 'debit': defaultdict(float)}
+    for entry in transactions:
+        entry_type = 'credit' if entry['type'] == 'credit' else 'debit'
+        daily[entry_type][entry['date']] += float(entry['amount'])
+    return daily
+
+def aggregate_by_category(transactions):
+    """Sum amounts per category, keyed by type then category"""
+    categories = {'credit': defaultdict(float), 'debit': defaultdict(float)}
+    for entry in transactions:
+        entry_type = 'credit' if entry['type'] == 'credit' else 'debit'
+        categories[entry_type][entry['category']] += float(entry['amount'])
+    return categories
+
+def find_highest_values(transactions):
+    """Find highest spending/income days and categories"""
+    return highest_values_from(aggregate_by_day(transactions),
+                               aggregate_by_category(transactions))
+
+def highest_values_from(daily, categories):
+    """Find highest days and categories from pre-computed aggregates"""
     def get_max(data):
         if not data:
             return {"amount": 0, "date": None, "category": None}
@@ -77,10 +114,10 @@ def find_highest_values(transactions):
         return {"amount": round(value, 2), "date": key, "category": key}
     
     return {
-        "highest_debit_day": get_max(daily_debits),
-        "highest_credit_day": get_max(daily_credits),
-        "highest_debit_category": get_max(debit_categories),
-        "highest_credit_category": get_max(credit_categories)
+        "highest_debit_day": get_max(daily['debit']),
+        "highest_credit_day": get_max(daily['credit']),
+        "highest_debit_category": get_max(categories['debit']),
+        "highest_credit_category": get_max(categories['credit'])
     }
 
 def empty_summary():
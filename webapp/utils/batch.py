@@ -0,0 +1,124 @@
+from datetime import datetime, timedelta
+from .analytics import (SUMMARY_PERIOD_DAYS, filter_entries, summarize_periods,
+                        aggregate_by_day, aggregate_by_category, highest_values_from,
+                        empty_summary)
+from .chart import timeframe_window, build_trend_chart, build_category_chart
+
+MAX_BATCH_QUERIES = 20
+
+class LedgerIndex:
+    """Ledger loaded once per batch, with intermediate results shared across sub-queries"""
+
+    def __init__(self, transactions, now=None):
+        self.transactions = transactions
+        # One clock for the whole batch so equal timeframes hit the same cache entry
+        self.now = now or datetime.now()
+        self._dated = [(datetime.strptime(e['date'], '%Y-%m-%d'), e) for e in transactions]
+        self._windows = {}
+        self._daily = {}
+        self._categories = {}
+
+    def window(self, start_date, end_date):
+        """Entries dated within [start_date, end_date], in ledger order"""
+        key = (start_date, end_date)
+        if key not in self._windows:
+            self._windows[key] = [e for d, e in self._dated if start_date <= d <= end_date]
+        return self._windows[key]
+
+    def daily_totals(self, start_date, end_date):
+        """Per-day credit/debit totals for a window"""
+        key = (start_date, end_date)
+        if key not in self._daily:
+            self._daily[key] = aggregate_by_day(self.window(start_date, end_date))
+        return self._daily[key]
+
+    def category_totals(self, start_date, end_date):
+        """Per-category credit/debit totals for a window"""
+        key = (start_date, end_date)
+        if key not in self._categories:
+            self._categories[key] = aggregate_by_category(self.window(start_date, end_date))
+        return self._categories[key]
+
+    def entries(self, params):
+        return filter_entries(self.transactions,
+                              entry_type=params.get('type'),
+                              category=params.get('category'),
+                              start_date=params.get('start_date'),
+                              end_date=params.get('end_date'),
+                              search=params.get('search'))
+
+    def summary(self, params):
+        if not self.transactions:
+            return empty_summary()
+
+        current_start_date = self.now - timedelta(days=SUMMARY_PERIOD_DAYS)
+        previous_start_date = current_start_date - timedelta(days=SUMMARY_PERIOD_DAYS)
+        highest_values = highest_values_from(
+            self.daily_totals(current_start_date, self.now),
+            self.category_totals(current_start_date, self.now)
+        )
+        return summarize_periods(self.window(current_start_date, self.now),
+                                 self.window(previous_start_date, current_start_date),
+                                 highest_values)
+
+    def trend(self, params):
+        start_date, end_date = timeframe_window(params.get('timeframe', '30'), self.now)
+        return build_trend_chart(self.daily_totals(start_date, end_date),
+                                 params.get('type', 'hybrid'))
+
+    def categories(self, params):
+        start_date, end_date = timeframe_window(params.get('timeframe', '30'), self.now)
+        return build_category_chart(self.category_totals(start_date, end_date),
+                                    params.get('type', 'debit'))
+
+QUERY_HANDLERS = {
+    'entries': LedgerIndex.entries,
+    'summary': LedgerIndex.summary,
+    'trend': LedgerIndex.trend,
+    'categories': LedgerIndex.categories
+}
+
+def validate_batch(queries):
+    """Validate a list of batch sub-queries"""
+    if not isinstance(queries, list) or not queries:
+        return False, "'queries' must be a non-empty list"
+
+    if len(queries) > MAX_BATCH_QUERIES:
+        return False, f"At most {MAX_BATCH_QUERIES} queries per batch"
+
+    seen_ids = set()
+    for query in queries:
+        if not isinstance(query, dict):
+            return False, "Each query must be an object"
+
+        query_type = query.get('type')
+        if query_type not in QUERY_HANDLERS:
+            return False, f"Unknown query type: {query_type}"
+
+        if not isinstance(query.get('params', {}), dict):
+            return False, f"Invalid params for query: {query_type}"
+
+        query_id = query.get('id', query_type)
+        if not isinstance(query_id, str):
+            return False, "Query id must be a string"
+        if query_id in seen_ids:
+            return False, f"Duplicate query id: {query_id}"
+        seen_ids.add(query_id)
+
+    return True, ""
+
+def run_batch(transactions, queries):
+    """Answer every sub-query against a single indexed copy of the ledger"""
+    index = LedgerIndex(transactions)
+    results = {}
+    errors = {}
+
+    for query in queries:
+        query_type = query['type']
+        query_id = query.get('id', query_type)
+        try:
+            results[query_id] = QUERY_HANDLERS[query_type](index, query.get('params', {}))
+        except Exception as e:
+            errors[query_id] = str(e)
+
+    return {"results": results, "errors": errors}
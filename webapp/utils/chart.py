@@ -1,25 +1,20 @@
 from datetime import datetime, timedelta
-from collections import defaultdict
+from .analytics import filter_by_date_range, aggregate_by_day, aggregate_by_category
+
+def timeframe_window(timeframe, end_date=None):
+    """Return the (start, end) datetimes covered by a chart timeframe"""
+    end_date = end_date or datetime.now()
+    return end_date - timedelta(days=int(timeframe)), end_date
 
 def get_trend_chart_data(transactions, timeframe='30', chart_type='hybrid'):
     """Prepare data for trend chart"""
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=int(timeframe))
-    
-    filtered = [e for e in transactions if 
-               datetime.strptime(e['date'], '%Y-%m-%d') >= start_date and
-               datetime.strptime(e['date'], '%Y-%m-%d') <= end_date]
-    
-    # Group by date and type
-    dates = sorted(list(set(e['date'] for e in filtered)))
-    daily_data = {date: {'credit': 0, 'debit': 0} for date in dates}
-    
-    for entry in filtered:
-        amount = float(entry['amount'])
-        if entry['type'] == 'credit':
-            daily_data[entry['date']]['credit'] += amount
-        else:
-            daily_data[entry['date']]['debit'] += amount
+    start_date, end_date = timeframe_window(timeframe)
+    filtered = filter_by_date_range(transactions, start_date, end_date)
+    return build_trend_chart(aggregate_by_day(filtered), chart_type)
+
+def build_trend_chart(daily, chart_type='hybrid'):
+    """Build trend chart response from per-day aggregates"""
+    dates = sorted(set(daily['credit']) | set(daily['debit']))
     
     # Prepare response based on chart type
     response = {
@@ -30,7 +25,7 @@ def get_trend_chart_data(transactions, timeframe='30', chart_type='hybrid'):
     if chart_type in ['hybrid', 'credit']:
         response["datasets"].append({
             "label": "Credits",
-            "data": [daily_data[date]['credit'] for date in dates],
+            "data": [daily['credit'].get(date, 0) for date in dates],
             "backgroundColor": "rgba(16, 185, 129, 0.7)",
             "borderColor": "rgba(16, 185, 129, 1)"
         })
@@ -38,7 +33,7 @@ def get_trend_chart_data(transactions, timeframe='30', chart_type='hybrid'):
     if chart_type in ['hybrid', 'debit']:
         response["datasets"].append({
             "label": "Debits",
-            "data": [daily_data[date]['debit'] for date in dates],
+            "data": [daily['debit'].get(date, 0) for date in dates],
             "backgroundColor": "rgba(239, 68, 68, 0.7)",
             "borderColor": "rgba(239, 68, 68, 1)"
         })
@@ -47,24 +42,12 @@ def get_trend_chart_data(transactions, timeframe='30', chart_type='hybrid'):
 
 def get_category_chart_data(transactions, timeframe='30', chart_type='debit'):
     """Prepare data for category chart"""
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=int(timeframe))
-    
-    filtered = [e for e in transactions if 
-               datetime.strptime(e['date'], '%Y-%m-%d') >= start_date and
-               datetime.strptime(e['date'], '%Y-%m-%d') <= end_date]
-    
-    # Group by category and type
-    categories = {
-        'credit': defaultdict(float),
-        'debit': defaultdict(float)
-    }
-    
-    for entry in filtered:
-        amount = float(entry['amount'])
-        categories[entry['type']][entry['category']] += amount
-    
-    # Prepare response
+    start_date, end_date = timeframe_window(timeframe)
+    filtered = filter_by_date_range(transactions, start_date, end_date)
+    return build_category_chart(aggregate_by_category(filtered), chart_type)
+
+def build_category_chart(categories, chart_type='debit'):
+    """Build category chart response from per-category aggregates"""
     response = {
         "labels": [],
         "datasets": [{